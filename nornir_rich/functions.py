@@ -1,23 +1,159 @@
 import logging
-import threading
-from typing import Any, List, Union, Dict, Tuple, Optional
-from rich.console import RenderableType, ConsoleRenderable
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import StringIO
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterable, List, Union, Dict, Tuple, Type, Optional
+from rich.console import Console, Group, RenderableType, ConsoleRenderable
 
 from nornir.core import Nornir
 from nornir.core.inventory import Inventory
 from nornir.core.task import AggregatedResult, MultiResult, Result
 
-from rich import print
 from rich.columns import Columns
 from rich.panel import Panel
 from rich.padding import PaddingDimensions
 from rich.pretty import Pretty
 from rich.protocol import is_renderable, rich_cast
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
+__all__ = [
+    "RichHelper",
+    "print_result",
+    "print_results",
+    "print_failed_hosts",
+    "print_inventory",
+]
 
-LOCK = threading.Lock()
+# Threads are only spawned on first use, so idle imports stay cheap.
+_RENDER_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Pre-bound Style instances indexed by the failed flag, so rich does not
+# re-parse a style string for every panel.
+_PANEL_STYLE = (Style(color="green"), Style(color="red"))
+
+_EQUALS_TEXT = Text.assemble((" =", "scope.equals"))
+
+_SEVERITY_LEVEL = attrgetter("severity_level")
+
+
+@lru_cache(maxsize=None)
+def _default_console() -> Console:
+    """
+    Create the shared output console on first use, so importing the
+    module (e.g. for `RichProgressBar`-only scripts) does not pay for
+    terminal detection.
+    """
+    return Console()
+
+
+_RENDERABLE_CACHE: Dict[Type[Any], bool] = {}
+
+
+def _is_renderable(obj: Any) -> bool:
+    """
+    Type-cached `rich.protocol.is_renderable`, so homogenous task results
+    (usually all `str`) pay the protocol check only once per type.
+    """
+    obj_type = type(obj)
+    cached = _RENDERABLE_CACHE.get(obj_type)
+    if cached is None:
+        cached = _RENDERABLE_CACHE.setdefault(obj_type, is_renderable(obj))
+    return cached
+
+
+def _buffered_print(
+    *renderables: Union[RenderableType, None], console: Optional[Console] = None
+) -> None:
+    """
+    Render into a per-call buffer without holding any lock and emit the
+    buffer with a single write under the target console's own lock, so
+    concurrent worker threads only serialize on the final stdout write
+    instead of the whole render, and writers to different consoles do
+    not contend at all.
+
+    Arguments:
+      renderables: Objects to render
+      console: Console to write to. Defaults to the module console.
+    """
+    target = console or _default_console()
+    buffer = Console(
+        file=StringIO(),
+        width=target.width,
+        force_terminal=target.is_terminal,
+        legacy_windows=target.legacy_windows,
+    )
+    for renderable in renderables:
+        buffer.print(renderable)
+    output: str = buffer.file.getvalue()  # type: ignore[attr-defined]
+    with target._lock:
+        target.file.write(output)
+        target.file.flush()
+
+
+@lru_cache(maxsize=32)
+def _cached_helper(
+    columns_settings: Tuple[Tuple[str, Any], ...],
+    padding: Optional[PaddingDimensions],
+    expand: bool,
+    equal: bool,
+    vars: Optional[Tuple[str, ...]],
+    severity_level: int,
+    failed: Optional[bool],
+    line_breaks: Optional[bool],
+) -> "RichHelper":
+    return RichHelper(
+        columns_settings=dict(columns_settings),
+        padding=padding,
+        expand=expand,
+        equal=equal,
+        vars=list(vars) if vars else None,
+        severity_level=severity_level,
+        failed=failed,
+        line_breaks=line_breaks,
+    )
+
+
+def _get_helper(
+    columns_settings: Optional[Dict[str, Any]],
+    padding: Optional[PaddingDimensions],
+    expand: bool,
+    equal: bool,
+    vars: Optional[List[str]],
+    severity_level: int,
+    failed: Optional[bool],
+    line_breaks: Optional[bool] = None,
+) -> "RichHelper":
+    """
+    Return a `RichHelper` for the given formatting options, reusing a
+    cached instance when the options were seen before. Falls back to a
+    fresh instance for unhashable `columns_settings`/`padding` values.
+    """
+    try:
+        return _cached_helper(
+            tuple(sorted((columns_settings or {}).items())),
+            padding,
+            expand,
+            equal,
+            tuple(vars) if vars else None,
+            severity_level,
+            failed,
+            line_breaks,
+        )
+    except TypeError:
+        return RichHelper(
+            columns_settings=columns_settings,
+            padding=padding,
+            expand=expand,
+            equal=equal,
+            vars=vars,
+            severity_level=severity_level,
+            failed=failed,
+            line_breaks=line_breaks,
+        )
 
 
 class RichHelper:
@@ -35,9 +171,19 @@ class RichHelper:
       line_breaks: if ``True`` line breaks in strings will be printed
     """
 
+    __slots__ = (
+        "columns_settings",
+        "vars",
+        "_vars_getter",
+        "severity_level",
+        "failed",
+        "line_breaks",
+        "_panel_cache",
+    )
+
     def __init__(
         self,
-        columns_settings: Dict[str, Any] = dict(),
+        columns_settings: Optional[Dict[str, Any]] = None,
         padding: Optional[PaddingDimensions] = None,
         expand: bool = False,
         equal: bool = True,
@@ -46,15 +192,36 @@ class RichHelper:
         failed: Optional[bool] = None,
         line_breaks: Optional[bool] = None,
     ) -> None:
-        self.columns_settings = columns_settings
-        self.columns_settings["expand"] = expand
-        self.columns_settings["equal"] = equal
+        self.columns_settings = {
+            **(columns_settings or {}),
+            "expand": expand,
+            "equal": equal,
+        }
         if padding:
             self.columns_settings["padding"] = padding
-        self.vars = vars
+        # Frozen as a tuple so the zip in _render_result iterates a
+        # C-level sequence.
+        self.vars: Optional[Tuple[str, ...]] = tuple(vars) if vars else None
+        # attrgetter extracts all requested attributes in one C-level
+        # call; the single-attribute form is wrapped so both shapes
+        # yield a tuple.
+        self._vars_getter: Optional[Callable[[Result], Tuple[Any, ...]]]
+        if not vars:
+            self._vars_getter = None
+        elif len(vars) > 1:
+            self._vars_getter = attrgetter(*vars)
+        else:
+            single_getter = attrgetter(vars[0])
+            self._vars_getter = lambda result: (single_getter(result),)
         self.severity_level = severity_level
         self.failed = failed
         self.line_breaks = line_breaks
+        # Rendered panels keyed by id() of the result object. Results are
+        # not mutated after task completion, so re-renders of the same
+        # object can return the cached panel. The result object itself is
+        # kept in the entry so a recycled id() can never alias a
+        # different result.
+        self._panel_cache: Dict[int, Tuple[Any, Panel]] = {}
 
     def print_aggregated_result(self, result: AggregatedResult) -> Panel:
         """
@@ -66,14 +233,31 @@ class RichHelper:
         Return:
           rich.panel.Panel
         """
-        mulit_results = [
-            self.print_multi_result(result=mulit_result, host=host)
-            for host, mulit_result in result.items()
-        ]
-        columns = Columns(mulit_results, **self.columns_settings)
+        cached = self._panel_cache.get(id(result))
+        if cached is not None and cached[0] is result:
+            return cached[1]
+        body: RenderableType
+        if len(result) > 1:
+            # Per-host panels are independent, so build them in parallel.
+            mulit_results = _RENDER_POOL.map(
+                lambda item: self.print_multi_result(result=item[1], host=item[0]),
+                result.items(),
+            )
+            body = Columns(mulit_results, **self.columns_settings)
+        elif result:
+            body = Columns(
+                (
+                    self.print_multi_result(result=mulit_result, host=host)
+                    for host, mulit_result in result.items()
+                ),
+                **self.columns_settings,
+            )
+        else:
+            body = Group()
         panel = Panel(
-            columns, title=result.name, style="red" if result.failed else "green"
+            body, title=result.name, style=_PANEL_STYLE[int(bool(result.failed))]
         )
+        self._panel_cache[id(result)] = (result, panel)
         return panel
 
     def print_multi_result(self, result: MultiResult, host: str = "HOST") -> Panel:
@@ -87,16 +271,22 @@ class RichHelper:
         Return:
           rich.panel.Panel
         """
+        sev = self.severity_level
+        filtered = [r for r in result if _SEVERITY_LEVEL(r) >= sev]
+        # Entries are already severity-filtered, so plain Results can go
+        # straight to the render body without re-checking.
         results: List[Union[Panel, None]] = [
-            self.print_dispatch(r)
-            for r in result
-            if r.severity_level >= self.severity_level
+            self._render_result(r) if type(r) is Result else self.print_dispatch(r)
+            for r in filtered
         ]
-        columns = [p for p in results if p is not None] or None
+        columns = [p for p in results if p is not None]
+        body: RenderableType = (
+            Columns(columns, **self.columns_settings) if columns else Group()
+        )
         panel = Panel(
-            Columns(columns, **self.columns_settings),
+            body,
             title=f"{host} | {result.name}",
-            style="red" if result.failed else "green",
+            style=_PANEL_STYLE[int(bool(result.failed))],
         )
         return panel
 
@@ -112,23 +302,35 @@ class RichHelper:
         """
         if result.severity_level < self.severity_level:
             return None
-        if self.vars:
-            return Panel(
-                self._scope_talbe(scope={x: getattr(result, x) for x in self.vars}),
+        return self._render_result(result)
+
+    def _render_result(self, result: Result) -> Panel:
+        """Render an individual task result without the severity check."""
+        cached = self._panel_cache.get(id(result))
+        if cached is not None and cached[0] is result:
+            return cached[1]
+        style = _PANEL_STYLE[int(bool(result.failed))]
+        if self.vars and self._vars_getter is not None:
+            panel = Panel(
+                self._scope_talbe(
+                    scope=dict(zip(self.vars, self._vars_getter(result)))
+                ),
                 title=result.name,
-                style="red" if result.failed else "green",
+                style=style,
             )
-
-        result_data: RenderableType
-        if not is_renderable(result.result):
-            result_data = Pretty(result.result) if result.result is not None else ""
         else:
-            result_data = rich_cast(result.result)
-        return Panel(
-            result_data,
-            title=result.name,
-            style="red" if result.failed else "green",
-        )
+            result_data: RenderableType
+            if not _is_renderable(result.result):
+                result_data = Pretty(result.result) if result.result is not None else ""
+            else:
+                result_data = rich_cast(result.result)
+            panel = Panel(
+                result_data,
+                title=result.name,
+                style=style,
+            )
+        self._panel_cache[id(result)] = (result, panel)
+        return panel
 
     def print_scopes(self, scopes: Dict[str, Any]) -> Columns:
         if self.vars:
@@ -159,6 +361,9 @@ class RichHelper:
         Return:
           rich.panel.Panel
         """
+        handler = _DISPATCH.get(type(result))
+        if handler is not None:
+            return handler(self, result)
         if isinstance(result, AggregatedResult):
             return self.print_aggregated_result(result)
         elif isinstance(result, MultiResult):
@@ -186,18 +391,19 @@ class RichHelper:
         items_table = Table.grid(padding=(0, 1), expand=False)
         items_table.add_column(justify="right")
 
-        def sort_items(item: Tuple[str, Any]) -> Tuple[bool, str]:
-            """Sort special variables first, then alphabetically."""
-            key, _ = item
-            return (not key.startswith("__"), key.lower())
-
-        items = sorted(scope.items(), key=sort_items)
+        # Decorate-sort-undecorate: special variables first, then
+        # alphabetically, with the sort key computed once per item.
+        decorated = [
+            ((not key.startswith("__"), key.lower()), key, value)
+            for key, value in scope.items()
+        ]
+        decorated.sort(key=itemgetter(0))
 
-        for key, value in items:
-            key_text = Text.assemble(
-                (key, "scope.key.special" if key.startswith("__") else "scope.key"),
-                (" =", "scope.equals"),
-            )
+        for (not_special, _), key, value in decorated:
+            is_special = not not_special
+            key_text = Text()
+            key_text.append(key, "scope.key.special" if is_special else "scope.key")
+            key_text.append_text(_EQUALS_TEXT)
 
             if self.line_breaks and isinstance(value, str):
                 value_text: ConsoleRenderable = Text(value.strip())
@@ -216,16 +422,26 @@ class RichHelper:
         )
 
 
+# O(1) dispatch for the concrete nornir result classes; subclasses fall
+# back to the isinstance chains at the call sites.
+_DISPATCH: Dict[Type[Any], Callable[[RichHelper, Any], Union[Panel, None]]] = {
+    AggregatedResult: RichHelper.print_aggregated_result,
+    MultiResult: RichHelper.print_multi_result,
+    Result: RichHelper.print_result,
+}
+
+
 def print_result(
     result: Union[Result, MultiResult, AggregatedResult],
     vars: Optional[List[str]] = None,
     failed: bool = False,
     severity_level: int = logging.INFO,
-    columns_settings: Dict[str, Any] = dict(),
+    columns_settings: Optional[Dict[str, Any]] = None,
     padding: Optional[PaddingDimensions] = None,
     expand: bool = False,
     equal: bool = True,
     line_breaks: bool = False,
+    console: Optional[Console] = None,
 ) -> None:
     """
     Prints an object of type `nornir.core.task.Result` || `nornir.core.task.MultiResult` || `nornir.core.task.AggregatedResult`
@@ -240,10 +456,10 @@ def print_result(
       expand: Expand columns to full width. Defaults to False.
       equal: Equal sized columns. Defaults to False
       line_breaks: if ``True`` line breaks in strings will be printed
+      console: Console to write to. Defaults to the module console.
     """
-    LOCK.acquire()
     equal = False if expand else equal
-    rh = RichHelper(
+    rh = _get_helper(
         columns_settings=columns_settings,
         padding=padding,
         expand=expand,
@@ -253,15 +469,63 @@ def print_result(
         failed=failed,
         line_breaks=line_breaks,
     )
-    try:
-        if isinstance(result, AggregatedResult):
-            print(rh.print_aggregated_result(result))
-        elif isinstance(result, MultiResult):
-            print(rh.print_multi_result(result))
-        elif isinstance(result, Result):
-            print(rh.print_result(result))
-    finally:
-        LOCK.release()
+    panel: Union[Panel, None] = None
+    handler = _DISPATCH.get(type(result))
+    if handler is not None:
+        panel = handler(rh, result)
+    elif isinstance(result, AggregatedResult):
+        panel = rh.print_aggregated_result(result)
+    elif isinstance(result, MultiResult):
+        panel = rh.print_multi_result(result)
+    elif isinstance(result, Result):
+        panel = rh.print_result(result)
+    if panel is not None:
+        _buffered_print(panel, console=console)
+
+
+def print_results(
+    results: Iterable[Union[Result, MultiResult, AggregatedResult]],
+    vars: Optional[List[str]] = None,
+    failed: bool = False,
+    severity_level: int = logging.INFO,
+    columns_settings: Optional[Dict[str, Any]] = None,
+    padding: Optional[PaddingDimensions] = None,
+    expand: bool = False,
+    equal: bool = True,
+    line_breaks: bool = False,
+    console: Optional[Console] = None,
+) -> None:
+    """
+    Prints multiple result objects in one go. Instead of calling
+    `print_result` in a loop, all panels are rendered first and emitted
+    with a single synchronized write.
+
+    Arguments:
+      results: Iterable of results from previous tasks
+      vars: Which attributes you want to print
+      failed: if ``True`` assume the task failed
+      severity_level: Print only errors with this severity level or higher
+      columns_settings: Settings passed to `rich.columns.Columns` object
+      padding: Optional padding around cells. Defaults to (0, 1).
+      expand: Expand columns to full width. Defaults to False.
+      equal: Equal sized columns. Defaults to False
+      line_breaks: if ``True`` line breaks in strings will be printed
+      console: Console to write to. Defaults to the module console.
+    """
+    equal = False if expand else equal
+    rh = _get_helper(
+        columns_settings=columns_settings,
+        padding=padding,
+        expand=expand,
+        equal=equal,
+        vars=vars,
+        severity_level=severity_level,
+        failed=failed,
+        line_breaks=line_breaks,
+    )
+    panels = [p for p in map(rh.print_dispatch, results) if p is not None]
+    if panels:
+        _buffered_print(*panels, console=console)
 
 
 def print_failed_hosts(
@@ -269,11 +533,12 @@ def print_failed_hosts(
     vars: Optional[List[str]] = None,
     failed: bool = False,
     severity_level: int = logging.INFO,
-    columns_settings: Dict[str, Any] = dict(),
+    columns_settings: Optional[Dict[str, Any]] = None,
     padding: Optional[PaddingDimensions] = None,
     expand: bool = False,
     equal: bool = True,
     line_breaks: bool = False,
+    console: Optional[Console] = None,
 ) -> None:
     """
     Prints results of all failed hosts from `nornir.core.task.AggregatedResult`
@@ -288,10 +553,12 @@ def print_failed_hosts(
       expand: Expand columns to full width. Defaults to False.
       equal: Equal sized columns. Defaults to False
       line_breaks: if ``True`` line breaks in strings will be printed
+      console: Console to write to. Defaults to the module console.
     """
-    LOCK.acquire()
+    if not result.failed_hosts:
+        return
     equal = False if expand else equal
-    rh = RichHelper(
+    rh = _get_helper(
         columns_settings=columns_settings,
         padding=padding,
         expand=expand,
@@ -301,11 +568,8 @@ def print_failed_hosts(
         failed=failed,
         line_breaks=line_breaks,
     )
-    try:
-        for host, multi_result in result.failed_hosts.items():
-            print(rh.print_multi_result(multi_result, host))
-    finally:
-        LOCK.release()
+    for host, multi_result in result.failed_hosts.items():
+        _buffered_print(rh.print_multi_result(multi_result, host), console=console)
 
 
 def print_inventory(
@@ -313,10 +577,11 @@ def print_inventory(
     vars: Optional[List[str]] = None,
     failed: bool = False,
     severity_level: int = logging.INFO,
-    columns_settings: Dict[str, Any] = dict(),
+    columns_settings: Optional[Dict[str, Any]] = None,
     padding: Optional[PaddingDimensions] = None,
     expand: bool = False,
     equal: bool = True,
+    console: Optional[Console] = None,
 ) -> None:
     """
     Prints results of all failed hosts from `nornir.core.task.AggregatedResult`
@@ -330,13 +595,13 @@ def print_inventory(
       padding: Optional padding around cells. Defaults to (0, 1).
       expand: Expand columns to full width. Defaults to False.
       equal: Equal sized columns. Defaults to False
+      console: Console to write to. Defaults to the module console.
     """
 
     if isinstance(inventory, Nornir):
         inventory = inventory.inventory
-    LOCK.acquire()
     equal = False if expand else equal
-    rh = RichHelper(
+    rh = _get_helper(
         columns_settings=columns_settings,
         padding=padding,
         expand=expand,
@@ -345,7 +610,4 @@ def print_inventory(
         severity_level=severity_level,
         failed=failed,
     )
-    try:
-        print(rh.print_scopes(inventory.hosts))
-    finally:
-        LOCK.release()
+    _buffered_print(rh.print_scopes(inventory.hosts), console=console)
@@ -1,17 +1,33 @@
 import threading
-from typing import Optional
+from queue import Empty, SimpleQueue
+from typing import Optional, Tuple
 from nornir.core.inventory import Host
 from nornir.core.task import AggregatedResult, MultiResult, Task
 from rich.progress import (
     Progress,
     BarColumn,
+    TextColumn,
     TimeElapsedColumn,
     TimeRemainingColumn,
     Table,
     Live,
 )
 from rich.panel import Panel
-from rich.protocol import rich_cast
+
+
+def _text_column(text_format: str) -> TextColumn:
+    """
+    Build a `TextColumn` for a format string, hoisting a single leading
+    style tag (e.g. ``[progress.description]{task.description}``) into
+    the pre-parsed column style so it is not re-parsed on every refresh.
+    Markup stays enabled because task fields (e.g. ``[green]Successful:``
+    descriptions) may carry their own tags.
+    """
+    if text_format.startswith("["):
+        style, sep, rest = text_format[1:].partition("]")
+        if sep and "[" not in rest:
+            return TextColumn(rest, style=style)
+    return TextColumn(text_format)
 
 
 class RichProgressBar:
@@ -21,25 +37,33 @@ class RichProgressBar:
         progress_percentage: str = "[progress.percentage]{task.completed:>5.0f}/{task.total}",
         total_hosts: Optional[int] = None,
     ) -> None:
-        self.lock = threading.Lock()
         self.total_hosts = total_hosts
+        # Host completions are queued and drained once per refresh tick,
+        # so many concurrent workers trigger a bounded number of bar
+        # updates instead of one redraw request each.
+        self._events: "SimpleQueue[Tuple[bool, bool]]" = SimpleQueue()
+        self._drain_stop = threading.Event()
+        self._drain_thread: Optional[threading.Thread] = None
+
+        description_column = _text_column(description)
+        percentage_column = _text_column(progress_percentage)
 
         self.progress_total = Progress(
-            description,
+            description_column,
             BarColumn(bar_width=80),
-            progress_percentage,
+            percentage_column,
             TimeElapsedColumn(),
             TimeRemainingColumn(),
         )
         self.progress_status = Progress(
-            description,
+            description_column,
             BarColumn(bar_width=96),
-            progress_percentage,
+            percentage_column,
         )
         self.progress_running_tasks = Progress(
-            description,
+            description_column,
             BarColumn(bar_width=80),
-            progress_percentage,
+            percentage_column,
         )
 
         self.overall_progress_table = Table.grid()
@@ -63,14 +87,10 @@ class RichProgressBar:
         self.progress_live = Live(self.progress_table, refresh_per_second=10)
 
     def task_started(self, task: Task) -> None:
-        hosts = (
-            self.total_hosts if self.total_hosts else len(task.nornir.inventory.hosts)
+        hosts = self.total_hosts or len(task.nornir.inventory.hosts)
+        self.concurrent_count = min(
+            hosts, getattr(task.nornir.runner, "num_workers", 1)
         )
-        workers = getattr(task.nornir.runner, "num_workers", 1)
-        if hosts < workers:
-            self.concurrent_count = hosts
-        else:
-            self.concurrent_count = workers
         self.total_hosts = hosts
 
         self.exit_status_panel.title = task.name
@@ -94,25 +114,58 @@ class RichProgressBar:
         self.overall_progress_table.add_row(self.progress_running_tasks)
 
         self.progress_live.start()
+        self._drain_stop.clear()
+        self._drain_thread = threading.Thread(target=self._drain_events, daemon=True)
+        self._drain_thread.start()
 
     def task_completed(self, task: Task, result: AggregatedResult) -> None:
+        self._drain_stop.set()
+        if self._drain_thread is not None:
+            self._drain_thread.join()
+            self._drain_thread = None
         self.progress_live.stop()
 
     def task_instance_started(self, task: Task, host: Host) -> None:
-        with self.lock:
-            self.progress_running_tasks.update(self.running_concurrent_bar, advance=1)
+        # rich.progress.Progress synchronizes internally, so no outer
+        # lock is needed around the updates.
+        self.progress_running_tasks.update(self.running_concurrent_bar, advance=1)
 
     def task_instance_completed(
         self, task: Task, host: Host, result: MultiResult
     ) -> None:
-        with self.lock:
-            self.progress_running_tasks.update(self.running_concurrent_bar, advance=-1)
-            self.progress_total.update(self.total, advance=1)
-            self.progress_status.update(
-                self.error if result.failed else self.successful, advance=1
-            )
-            if result.changed:
-                self.progress_status.update(self.changed, advance=1)
+        self._events.put((bool(result.failed), bool(result.changed)))
+
+    def _drain_events(self) -> None:
+        # Runs in a daemon thread; one drain per refresh tick plus a
+        # final drain after the task completed.
+        while not self._drain_stop.wait(0.1):
+            self._drain_once()
+        self._drain_once()
+
+    def _drain_once(self) -> None:
+        completed = failed = changed = 0
+        while True:
+            try:
+                event_failed, event_changed = self._events.get_nowait()
+            except Empty:
+                break
+            completed += 1
+            if event_failed:
+                failed += 1
+            if event_changed:
+                changed += 1
+        if not completed:
+            return
+        self.progress_running_tasks.update(
+            self.running_concurrent_bar, advance=-completed
+        )
+        self.progress_total.update(self.total, advance=completed)
+        if failed:
+            self.progress_status.update(self.error, advance=failed)
+        if completed - failed:
+            self.progress_status.update(self.successful, advance=completed - failed)
+        if changed:
+            self.progress_status.update(self.changed, advance=changed)
 
     def subtask_instance_started(self, task: Task, host: Host) -> None: ...
 
@@ -12,24 +12,24 @@ from nornir.core.task import Result, MultiResult, AggregatedResult
 from nornir_rich.functions import RichHelper
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def host_one() -> Host:
     return Host(name="host1", hostname="host1.test", username="user", password="pass")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def result_one(host_one: Host) -> Result:
     return Result(host=host_one, result="Demo result one")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def result_two(host_one: Host) -> Result:
     return Result(
         host=host_one, result="Demo result two", diff="changed 'one' to 'two'"
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def result_three(host_one: Host) -> Result:
     return Result(
         host=host_one,
@@ -38,12 +38,12 @@ def result_three(host_one: Host) -> Result:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def result_failed_one(host_one: Host) -> Result:
     return Result(host=host_one, result="Demo failed result", failed=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def result_failed_two(host_one: Host) -> Result:
     return Result(
         host=host_one,
@@ -53,21 +53,21 @@ def result_failed_two(host_one: Host) -> Result:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def multiresult_one(result_one: Result) -> MultiResult:
     mr = MultiResult("MultiResult 1")
     mr.append(result_one)
     return mr
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def multiresult_two(result_one: Result, result_two: Result) -> MultiResult:
     mr = MultiResult("MultiResult 2")
     mr.extend([result_one, result_two])
     return mr
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def multiresult_three(
     result_one: Result, result_two: Result, result_failed_one: Result
 ) -> MultiResult:
@@ -76,14 +76,14 @@ def multiresult_three(
     return mr
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def aggregatedresult_one(multiresult_one: MultiResult) -> AggregatedResult:
     return AggregatedResult(
         name="Aggregated Result 1", **{"host1.test": multiresult_one}
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def aggregatedresult_two(
     multiresult_two: MultiResult,
 ) -> AggregatedResult:
@@ -97,8 +97,17 @@ def aggregatedresult_two(
     )
 
 
+# Reused across render() calls so the theme/style setup is only paid
+# once; each call swaps in a fresh StringIO.
+_RENDER_CONSOLE = Console(file=io.StringIO(), width=50, legacy_windows=False)
+
+
 def render(panel: Union[Panel, None], width: int = 50) -> str:
-    console = Console(file=io.StringIO(), width=width, legacy_windows=False)
+    if width == 50:
+        console = _RENDER_CONSOLE
+        console.file = io.StringIO()
+    else:
+        console = Console(file=io.StringIO(), width=width, legacy_windows=False)
     console.print(panel)
     output: str = console.file.getvalue()  # type: ignore
     print(repr(output))